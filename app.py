@@ -1,189 +1,135 @@
 import os
-import re
 import json
 from flask import Flask, render_template, url_for, send_from_directory
+from jinja2 import FileSystemBytecodeCache
+try:
+    from whitenoise import WhiteNoise
+    WHITENOISE_AVAILABLE = True
+except ImportError:
+    WHITENOISE_AVAILABLE = False
+
+# Bib parsing and publication formatting are shared with render_static.py so the
+# dev server and the static build cannot drift apart.
+from bibliography import parse_bib_file, make_highlight_ctx, format_publication
 
 app = Flask(__name__)
 
+# Outside debug mode templates never change under a running server: skip the
+# per-request mtime check and keep compiled bytecode across restarts.
+# (app.run(debug=True) turns auto_reload back on for local development.)
+if not app.debug:
+    _jinja_cache = os.path.join(os.path.dirname(__file__), '.jinja_cache', 'flask')
+    os.makedirs(_jinja_cache, exist_ok=True)
+    app.jinja_env.auto_reload = False
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(_jinja_cache)
+
+# Serve pdfs/ through WhiteNoise ahead of Flask so downloads are streamed via
+# wsgi.file_wrapper rather than through send_from_directory. The pdfs() route
+# below only runs when whitenoise isn't installed. autorefresh is on because
+# `make` in cv/ rewrites pdfs/ in place while the server runs, so WhiteNoise
+# stats the file and builds headers on every request, as Flask would; this is
+# a dev-server convenience, not a production serving path.
+PDFS_DIR = os.path.join(os.path.dirname(__file__), 'pdfs')
+if WHITENOISE_AVAILABLE:
+    app.wsgi_app = WhiteNoise(app.wsgi_app, root=PDFS_DIR, prefix='pdfs/', autorefresh=True)
+
 # ─────────────────────────────────────────────────────────────────────────────
-# CV HTML generation (same logic as render_static.py for consistency)
+# CV data loading (parsing/formatting shared with render_static.py)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def parse_bib_file(bib_path):
-    """Parse a .bib file and return a dict of key -> entry data."""
-    entries = {}
-    if not os.path.exists(bib_path):
-        return entries
-    with open(bib_path, 'r') as f:
-        content = f.read()
-    
-    pattern = r'@(\w+)\{([^,]+),([^@]*)'
-    for match in re.finditer(pattern, content, re.DOTALL):
-        entry_type = match.group(1).lower()
-        key = match.group(2).strip()
-        fields_str = match.group(3)
-        
-        fields = {'_type': entry_type}
-        field_pattern = r'(\w+)\s*=\s*\{([^}]*)\}'
-        for field_match in re.finditer(field_pattern, fields_str):
-            field_name = field_match.group(1).lower()
-            field_value = field_match.group(2).strip()
-            field_value = field_value.replace('\\#', '#').replace('\n', ' ').strip()
-            fields[field_name] = field_value
-        
-        entries[key] = fields
-    return entries
-
-
-def format_authors(author_str, highlight_name=None):
-    authors = [a.strip() for a in author_str.split(' and ')]
-    formatted = []
-    for author in authors:
-        if ',' in author:
-            parts = author.split(',')
-            name = f"{parts[1].strip()} {parts[0].strip()}"
-        else:
-            name = author
-        if highlight_name and (highlight_name.lower() in name.lower() or 
-                               any(p.lower() in name.lower() for p in highlight_name.split())):
-            name = f'<span class="highlight">{name}</span>'
-        formatted.append(name)
-    
-    if len(formatted) == 1:
-        return formatted[0]
-    elif len(formatted) == 2:
-        return f"{formatted[0]} and {formatted[1]}"
-    else:
-        return ", ".join(formatted[:-1]) + f", and {formatted[-1]}"
-
-
-def format_publication(entry, highlight_name=None):
-    authors = format_authors(entry.get('author', ''), highlight_name)
-    title = entry.get('title', '')
-    year = entry.get('year', '')
-    url = entry.get('url', '')
-    entry_type = entry.get('_type', '')
-    
-    if entry_type == 'inproceedings':
-        venue = entry.get('booktitle', '')
-        if entry.get('volume'):
-            venue += f", vol. {entry['volume']}"
-        if entry.get('pages'):
-            venue += f", pp. {entry['pages']}"
-    elif entry_type == 'article':
-        venue = entry.get('journal', '')
-        if entry.get('volume'):
-            venue += f", vol. {entry['volume']}"
-    elif entry_type == 'mastersthesis':
-        thesis_type = entry.get('type', "Master's Thesis")
-        venue = f"{thesis_type}, {entry.get('school', '')}"
-    else:
-        venue = entry.get('journal', '') or entry.get('booktitle', '')
-    
-    if url:
-        title_html = f'<a href="{url}" target="_blank">{title}</a>'
-    else:
-        title_html = title
-    
-    return f'<p class="pub-entry">{authors}. <strong>{title_html}</strong>. <em>{venue}</em>, {year}.</p>'
-
-
-def generate_cv_html():
-    """Generate CV HTML content from cv.json and roytburg.bib."""
-    root = os.path.dirname(__file__)
-    cv_json_path = os.path.join(root, 'cv', 'cv.json')
-    bib_path = os.path.join(root, 'roytburg.bib')
-    
-    if not os.path.exists(cv_json_path):
-        return '<p>CV data not found.</p>'
-    
-    with open(cv_json_path, 'r') as f:
-        cv_data = json.load(f)
-    
-    bib_entries = parse_bib_file(bib_path)
-    name = f"{cv_data['given-name']} {cv_data['sur-name']}"
-    html_parts = []
-    
-    # Summary
-    if 'summary' in cv_data:
-        html_parts.append(f'''
-      <section class="cv-section">
-        <h2>Summary</h2>
-        <p>{cv_data["summary"]}</p>
-      </section>''')
-    
-    # Education
-    if 'degrees' in cv_data:
-        html_parts.append('''
-      <section class="cv-section">
-        <h2>Education</h2>''')
-        for deg in cv_data['degrees']:
-            html_parts.append(f'''
-        <div class="cv-entry">
-          <div class="cv-entry-header">
-            <span class="cv-degree">{deg["degree"]}, {deg["discipline"]}</span>
-            <span class="cv-year">{deg["year"]}</span>
-          </div>
-          <div class="cv-school">{deg["school"]}</div>
-        </div>''')
-        html_parts.append('      </section>')
-    
-    # Experience
-    if 'employment' in cv_data:
-        html_parts.append('''
-      <section class="cv-section">
-        <h2>Experience</h2>''')
-        for job in cv_data['employment']:
-            start = f"{job['start-month']} {job['start-year']}"
-            end = f"{job['end-month']} {job['end-year']}" if 'end-year' in job else "Present"
-            html_parts.append(f'''
-        <div class="cv-entry">
-          <div class="cv-entry-header">
-            <span class="cv-title">{job["title"]}</span>
-            <span class="cv-dates">{start} – {end}</span>
-          </div>
-          <div class="cv-org">{job["affiliation"]}, {job["location"]}</div>
-          <p class="cv-description">{job["description"]}</p>
-        </div>''')
-        html_parts.append('      </section>')
-    
-    # Publications
-    if 'bibliography' in cv_data:
-        html_parts.append('''
-      <section class="cv-section">
-        <h2>Publications</h2>''')
-        bib = cv_data['bibliography']
-        if 'conference-papers' in bib and bib['conference-papers']:
-            html_parts.append('        <h3>Conference Papers</h3>')
-            for key in bib['conference-papers']:
-                if key in bib_entries:
-                    html_parts.append('        ' + format_publication(bib_entries[key], name))
-        if 'theses' in bib and bib['theses']:
-            html_parts.append('        <h3>Theses</h3>')
-            for key in bib['theses']:
-                if key in bib_entries:
-                    html_parts.append('        ' + format_publication(bib_entries[key], name))
-        html_parts.append('      </section>')
-    
-    # Awards
-    if 'awards' in cv_data:
-        html_parts.append('''
-      <section class="cv-section">
-        <h2>Awards & Recognition</h2>
-        <ul class="cv-list">''')
-        for award in cv_data['awards']:
-            year_str = str(award.get('year', '')) or ', '.join(str(y) for y in award.get('years', []))
-            html_parts.append(f'          <li>{award["title"]}, {year_str}</li>')
-        html_parts.append('        </ul>\n      </section>')
-    
-    # Skills
-    if 'skills' in cv_data:
-        html_parts.append('''
-      <section class="cv-section">
-        <h2>Skills</h2>
-        <p class="cv-skills">''' + ' · '.join(cv_data['skills']) + '</p>\n      </section>')
-    
-    return '\n'.join(html_parts)
+# Parsed file contents keyed by path -> (mtime_ns, data), so warm /cv requests
+# skip the file read and regex parse until the source file changes on disk.
+_BIB_CACHE = {}
+_CV_CACHE = {}
+
+# CV template context, keyed by the (cv.json, roytburg.bib) mtimes it was built from.
+_cv_context_cache = {'key': None, 'context': None}
+
+CV_JSON_PATH = os.path.join(os.path.dirname(__file__), 'cv', 'cv.json')
+BIB_PATH = os.path.join(os.path.dirname(__file__), 'roytburg.bib')
+
+
+def _cached_load(cache, path, loader):
+    """Return loader(path), memoized on the file's mtime."""
+    mtime = os.stat(path).st_mtime_ns
+    hit = cache.get(path)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    data = loader(path)
+    cache[path] = (mtime, data)
+    return data
+
+
+def _load_json(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def load_bib(bib_path):
+    """Parsed bib entries plus a per-parse formatting memo, cached until roytburg.bib changes."""
+    try:
+        return _cached_load(_BIB_CACHE, bib_path, _parse_bib)
+    except FileNotFoundError:
+        return {'entries': {}, 'formatted': {}}
+
+
+def _parse_bib(bib_path):
+    # Each parse gets a fresh memo, so formatted HTML can never outlive the
+    # entries it was built from (even if another thread re-parses meanwhile).
+    return {'entries': parse_bib_file(bib_path), 'formatted': {}}
+
+
+def load_cv_data(cv_json_path):
+    """Parsed cv.json, cached until the file changes."""
+    return _cached_load(_CV_CACHE, cv_json_path, _load_json)
+
+
+def formatted_publication(bib, key, highlight_ctx):
+    """format_publication() for a bib key, memoized on the parse in `bib`."""
+    memo_key = (key, highlight_ctx)
+    html = bib['formatted'].get(memo_key)
+    if html is None:
+        html = format_publication(bib['entries'][key], highlight_ctx)
+        bib['formatted'][memo_key] = html
+    return html
+
+
+def build_cv_context():
+    """Load cv.json and roytburg.bib into the context rendered by cv.html."""
+    try:
+        cv_data = load_cv_data(CV_JSON_PATH)
+    except FileNotFoundError:
+        return {'cv': None, 'pubs': None}
+
+    bib_data = load_bib(BIB_PATH)
+    highlight_ctx = make_highlight_ctx(f"{cv_data['given-name']} {cv_data['sur-name']}")
+
+    # Only sections with at least one resolvable bib key are rendered
+    bib = cv_data.get('bibliography', {})
+    pubs = []
+    for category, heading in [('conference-papers', 'Conference Papers'), ('theses', 'Theses')]:
+        entries = [formatted_publication(bib_data, key, highlight_ctx)
+                   for key in bib.get(category, []) if key in bib_data['entries']]
+        if entries:
+            pubs.append((heading, entries))
+
+    return {'cv': cv_data, 'pubs': pubs}
+
+
+def _mtime_ns(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def get_cv_context():
+    """Return the CV template context, rebuilding only when cv.json or the bib changes."""
+    key = (_mtime_ns(CV_JSON_PATH), _mtime_ns(BIB_PATH))
+    if _cv_context_cache['key'] != key:
+        _cv_context_cache['context'] = build_cv_context()
+        _cv_context_cache['key'] = key
+    return _cv_context_cache['context']
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -192,7 +138,7 @@ def generate_cv_html():
 
 @app.route('/pdfs/<path:filename>')
 def pdfs(filename):
-    """Serve files from pdfs/ folder."""
+    """Serve files from pdfs/ folder (fallback when WhiteNoise is unavailable)."""
     return send_from_directory('pdfs', filename)
 
 
@@ -208,8 +154,7 @@ def publications():
 
 @app.route('/cv')
 def cv():
-    cv_content = generate_cv_html()
-    return render_template('cv.html', cv_content=cv_content)
+    return render_template('cv.html', **get_cv_context())
 
 
 @app.route('/research')
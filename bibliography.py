@@ -0,0 +1,258 @@
+"""BibTeX parsing and publication formatting shared by app.py and render_static.py.
+
+Importing this module has no side effects, so the Flask app can use it without
+pulling in the static-site build.
+"""
+
+import re
+try:
+    import bibtexparser
+    # parse_file is the v2 API; bibtexparser 1.x lacks it and uses the scanner instead
+    BIBTEXPARSER_AVAILABLE = hasattr(bibtexparser, 'parse_file')
+    BIBTEXPARSER_VERSION = getattr(bibtexparser, '__version__', None)
+except ImportError:
+    BIBTEXPARSER_AVAILABLE = False
+    BIBTEXPARSER_VERSION = None
+
+# BibTeX entry (`@type{key, fields...`) and `name = {value}` field patterns.
+_ENTRY_RE = re.compile(r'@(\w+)\{([^,]+),([^@]*)', re.DOTALL)
+_FIELD_RE = re.compile(r'(\w+)\s*=\s*\{([^}]*)\}')
+
+
+# Unescape `\#` and flatten newlines in a single pass over each field value.
+_CLEAN_RE = re.compile(r'\\#|\n')
+_CLEAN_MAP = {'\\#': '#', '\n': ' '}
+
+
+def _clean_field(value):
+    return _CLEAN_RE.sub(lambda m: _CLEAN_MAP[m.group(0)], value).strip()
+
+
+def parse_bib_file(bib_path):
+    """Parse a .bib file and return a dict of key -> entry data."""
+    if BIBTEXPARSER_AVAILABLE:
+        return _parse_bib_bibtexparser(bib_path)
+    return _parse_bib_scan(bib_path)
+
+
+def _parse_bib_bibtexparser(bib_path):
+    """Parse with bibtexparser v2 (handles nested braces, @string, comments)."""
+    library = bibtexparser.parse_file(bib_path)
+    entries = {}
+    for entry in library.entries:
+        fields = {'_type': entry.entry_type.lower()}
+        for field in entry.fields:
+            fields[field.key.lower()] = _clean_field(str(field.value))
+        entries[entry.key] = fields
+    return entries
+
+
+def _parse_bib_scan(bib_path):
+    """Dependency-free parser; falls back to the regex parser on malformed input."""
+    # UTF-8 like bibtexparser.parse_file, not the locale default
+    with open(bib_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    try:
+        entries = {}
+        for entry_type, key, raw_fields in _iter_entries(content):
+            fields = {'_type': entry_type}
+            for name, value in raw_fields:
+                fields[name] = _clean_field(value)
+            entries[key] = fields
+        return entries
+    except ValueError:
+        return _parse_bib_regex(content)
+
+
+# Scanner tokens. The scanner jumps between matches of these with the C regex
+# engine instead of stepping through the text one character at a time.
+_BRACE_RE = re.compile(r'[{}]')
+# Start of an entry (`@type{`); an `@` not followed by an identifier and `{`
+# (e.g. an email in a comment) is skipped.
+_ENTRY_START_RE = re.compile(r'@(\w+)\s*\{')
+_KEY_RE = re.compile(r'[^,}]*')
+_FIELD_START_RE = re.compile(r'[\s,]*([\w-]+)\s*=\s*')
+# Fast path for the common `name = {flat value}` field: no nested braces and
+# no `#` concatenation, so one match reads the whole field.
+_FLAT_FIELD_RE = re.compile(r'[\s,]*([\w-]+)\s*=\s*\{([^{}]*)\}(?!\s*#)')
+_SEP_RE = re.compile(r'[\s,]*')
+_ENTRY_END_RE = re.compile(r'[\s,]*\}')
+_BARE_VALUE_RE = re.compile(r'[^,}#\s]+')
+_CONCAT_RE = re.compile(r'\s*#\s*')
+
+
+def _match_brace(text, start):
+    """Index of the '}' closing the '{' at text[start]."""
+    depth = 0
+    for m in _BRACE_RE.finditer(text, start):
+        if m.group() == '{':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return m.start()
+    raise ValueError(f'unbalanced braces at offset {start}')
+
+
+def _read_value(text, i, key):
+    """Read one field value starting at text[i], joining `#` concatenations.
+
+    Returns (value, index just past it). Bare words such as @string macro names
+    are kept verbatim.
+    """
+    pieces = []
+    while True:
+        c = text[i:i + 1]
+        if c == '{':
+            end = _match_brace(text, i)
+            pieces.append(text[i + 1:end])
+            i = end + 1
+        elif c == '"':
+            end = text.find('"', i + 1)
+            if end == -1:
+                raise ValueError(f'unterminated string in entry {key}')
+            pieces.append(text[i + 1:end])
+            i = end + 1
+        else:
+            bare = _BARE_VALUE_RE.match(text, i)
+            if not bare:
+                raise ValueError(f'missing value in entry {key}')
+            pieces.append(bare.group())
+            i = bare.end()
+        concat = _CONCAT_RE.match(text, i)
+        if not concat:
+            return ''.join(pieces), i
+        i = concat.end()
+
+
+def _iter_entries(text):
+    """Yield (type, key, [(field, value), ...]) in one linear scan over a .bib string.
+
+    Raises ValueError on malformed or truncated input.
+    """
+    n = len(text)
+    i = text.find('@')
+    while i != -1:
+        m = _ENTRY_START_RE.match(text, i)
+        if not m:
+            i = text.find('@', i + 1)
+            continue
+        entry_type = m.group(1).lower()
+        brace = m.end() - 1
+        if entry_type in ('comment', 'string', 'preamble'):
+            i = text.find('@', _match_brace(text, brace))
+            continue
+
+        # The key ends at the first comma, or at `}` for a field-less entry
+        end = _KEY_RE.match(text, brace + 1).end()
+        if end >= n:
+            raise ValueError(f'entry without key at offset {i}')
+        key = text[brace + 1:end].strip()
+
+        fields = []
+        i = end
+        while True:
+            flat = _FLAT_FIELD_RE.match(text, i)
+            if flat:
+                fields.append((flat.group(1).lower(), flat.group(2)))
+                i = flat.end()
+                continue
+            close = _ENTRY_END_RE.match(text, i)
+            if close:
+                i = close.end()
+                break
+            fm = _FIELD_START_RE.match(text, i)
+            if not fm:
+                if _SEP_RE.match(text, i).end() >= n:
+                    raise ValueError(f'unterminated entry {key}')
+                raise ValueError(f'malformed field in entry {key} at offset {i}')
+            value, i = _read_value(text, fm.end(), key)
+            fields.append((fm.group(1).lower(), value))
+
+        yield entry_type, key, fields
+        i = text.find('@', i)
+
+
+def _parse_bib_regex(content):
+    """Original regex parser for flat `name = {value}` entries (no nested braces)."""
+    entries = {}
+    for entry_type, key, fields_str in _ENTRY_RE.findall(content):
+        fields = {'_type': entry_type.lower()}
+        for field_name, field_value in _FIELD_RE.findall(fields_str):
+            fields[field_name.lower()] = _clean_field(field_value)
+
+        entries[key.strip()] = fields
+    return entries
+
+
+def make_highlight_ctx(highlight_name):
+    """Precompute the lowercased name and name parts used to highlight an author."""
+    if not highlight_name:
+        return None
+    return highlight_name.lower(), tuple(p.lower() for p in highlight_name.split())
+
+
+def format_authors(author_str, highlight_ctx=None, equal_contribution=None):
+    """Format author string, optionally highlighting a name and marking equal contributors."""
+    authors = [a.strip() for a in author_str.split(' and ')]
+    formatted = []
+    for i, author in enumerate(authors):
+        if ',' in author:
+            parts = author.split(',')
+            name = f"{parts[1].strip()} {parts[0].strip()}"
+        else:
+            name = author
+
+        if highlight_ctx:
+            highlight_lower, parts_lower = highlight_ctx
+            name_lower = name.lower()
+            if highlight_lower in name_lower or any(p in name_lower for p in parts_lower):
+                name = f'<span class="highlight">{name}</span>'
+
+        # Add star for equal contribution
+        if equal_contribution and i in equal_contribution:
+            name = f'{name}<span class="equal-contrib">*</span>'
+
+        formatted.append(name)
+
+    if len(formatted) == 1:
+        return formatted[0]
+    elif len(formatted) == 2:
+        return f"{formatted[0]} and {formatted[1]}"
+    else:
+        return ", ".join(formatted[:-1]) + f", and {formatted[-1]}"
+
+
+def format_publication(entry, highlight_ctx=None):
+    """Format a single publication entry as HTML."""
+    authors = format_authors(entry.get('author', ''), highlight_ctx)
+    title = entry.get('title', '')
+    year = entry.get('year', '')
+    url = entry.get('url', '')
+
+    entry_type = entry.get('_type', '')
+
+    if entry_type == 'inproceedings':
+        parts = [entry.get('booktitle', '')]
+        if entry.get('volume'):
+            parts.append(f", vol. {entry['volume']}")
+        if entry.get('pages'):
+            parts.append(f", pp. {entry['pages']}")
+        venue = ''.join(parts)
+    elif entry_type == 'article':
+        parts = [entry.get('journal', '')]
+        if entry.get('volume'):
+            parts.append(f", vol. {entry['volume']}")
+        venue = ''.join(parts)
+    elif entry_type == 'mastersthesis':
+        thesis_type = entry.get('type', "Master's Thesis")
+        venue = f"{thesis_type}, {entry.get('school', '')}"
+    else:
+        venue = entry.get('journal', '') or entry.get('booktitle', '')
+
+    if url:
+        title_html = f'<a href="{url}" target="_blank">{title}</a>'
+    else:
+        title_html = title
+
+    return f'<p class="pub-entry">{authors}. <strong>{title_html}</strong>. <em>{venue}</em>, {year}.</p>'
@@ -9,18 +9,23 @@ Then you can publish the `docs/` folder with GitHub Pages (branch: master, folde
 """
 
 import os
-import re
 import json
+import hashlib
+import pickle
 import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 try:
     import markdown
     MARKDOWN_AVAILABLE = True
 except ImportError:
     MARKDOWN_AVAILABLE = False
     print("Warning: markdown library not installed. Run: pip install markdown")
+import bibliography
+from bibliography import parse_bib_file, make_highlight_ctx, format_authors
 
 ROOT = os.path.dirname(__file__) or '.'
 TEMPLATES = os.path.join(ROOT, 'templates')
@@ -29,6 +34,9 @@ OUT = os.path.join(ROOT, 'docs')
 PDFS = os.path.join(ROOT, 'pdfs')
 CV_DIR = os.path.join(ROOT, 'cv')
 BLOG_POSTS = os.path.join(ROOT, 'blog_posts')
+# Kept apart from app.py's cache: bytecode keys ignore env options like autoescape.
+JINJA_CACHE = os.path.join(ROOT, '.jinja_cache', 'static')
+BIB_CACHE = os.path.join(ROOT, '.cache', 'bib.pkl')
 
 PAGES = {
     'research': {
@@ -53,221 +61,75 @@ PAGES = {
 # CV HTML generation from cv.json and roytburg.bib
 # ─────────────────────────────────────────────────────────────────────────────
 
-def parse_bib_file(bib_path):
-    """Parse a .bib file and return a dict of key -> entry data."""
-    entries = {}
-    with open(bib_path, 'r') as f:
-        content = f.read()
-
-    pattern = r'@(\w+)\{([^,]+),([^@]*)'
-    for match in re.finditer(pattern, content, re.DOTALL):
-        entry_type = match.group(1).lower()
-        key = match.group(2).strip()
-        fields_str = match.group(3)
-
-        fields = {'_type': entry_type}
-        field_pattern = r'(\w+)\s*=\s*\{([^}]*)\}'
-        for field_match in re.finditer(field_pattern, fields_str):
-            field_name = field_match.group(1).lower()
-            field_value = field_match.group(2).strip()
-            field_value = field_value.replace('\\#', '#').replace('\n', ' ').strip()
-            fields[field_name] = field_value
-
-        entries[key] = fields
-    return entries
-
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
 
-def format_authors(author_str, highlight_name=None, equal_contribution=None):
-    """Format author string, optionally highlighting a name and marking equal contributors."""
-    authors = [a.strip() for a in author_str.split(' and ')]
-    formatted = []
-    for i, author in enumerate(authors):
-        if ',' in author:
-            parts = author.split(',')
-            name = f"{parts[1].strip()} {parts[0].strip()}"
-        else:
-            name = author
-
-        if highlight_name and (highlight_name.lower() in name.lower() or
-                               any(p.lower() in name.lower() for p in highlight_name.split())):
-            name = f'<span class="highlight">{name}</span>'
-
-        # Add star for equal contribution
-        if equal_contribution and i in equal_contribution:
-            name = f'{name}<span class="equal-contrib">*</span>'
-
-        formatted.append(name)
-
-    if len(formatted) == 1:
-        return formatted[0]
-    elif len(formatted) == 2:
-        return f"{formatted[0]} and {formatted[1]}"
-    else:
-        return ", ".join(formatted[:-1]) + f", and {formatted[-1]}"
-
-
-def format_publication(entry, highlight_name=None):
-    """Format a single publication entry as HTML."""
-    authors = format_authors(entry.get('author', ''), highlight_name)
-    title = entry.get('title', '')
-    year = entry.get('year', '')
-    url = entry.get('url', '')
-
-    entry_type = entry.get('_type', '')
-
-    if entry_type == 'inproceedings':
-        venue = entry.get('booktitle', '')
-        if entry.get('volume'):
-            venue += f", vol. {entry['volume']}"
-        if entry.get('pages'):
-            venue += f", pp. {entry['pages']}"
-    elif entry_type == 'article':
-        venue = entry.get('journal', '')
-        if entry.get('volume'):
-            venue += f", vol. {entry['volume']}"
-    elif entry_type == 'mastersthesis':
-        thesis_type = entry.get('type', "Master's Thesis")
-        venue = f"{thesis_type}, {entry.get('school', '')}"
-    else:
-        venue = entry.get('journal', '') or entry.get('booktitle', '')
-
-    if url:
-        title_html = f'<a href="{url}" target="_blank">{title}</a>'
-    else:
-        title_html = title
-
-    return f'<p class="pub-entry">{authors}. <strong>{title_html}</strong>. <em>{venue}</em>, {year}.</p>'
-
-
-def generate_cv_html(cv_data, bib_entries, publications_data):
-    """Generate the full CV HTML content."""
-    name = f"{cv_data['given-name']} {cv_data['sur-name']}"
-    html_parts = []
-
-    # Summary
-    if 'summary' in cv_data:
-        html_parts.append(f'''
-      <section class="cv-section">
-        <h2>Summary</h2>
-        <p>{cv_data["summary"]}</p>
-      </section>''')
-
-    # Education
-    if 'degrees' in cv_data:
-        html_parts.append('''
-      <section class="cv-section">
-        <h2>Education</h2>''')
-        for deg in cv_data['degrees']:
-            html_parts.append(f'''
-        <div class="cv-entry">
-          <div class="cv-entry-header">
-            <span class="cv-degree">{deg["degree"]}, {deg["discipline"]}</span>
-            <span class="cv-year">{deg["year"]}</span>
-          </div>
-          <div class="cv-school">{deg["school"]}</div>
-        </div>''')
-        html_parts.append('      </section>')
-
-    # Experience/Positions
-    if 'employment' in cv_data:
-        html_parts.append('''
-      <section class="cv-section">
-        <h2>Experience</h2>''')
-        for job in cv_data['employment']:
-            start = f"{job['start-month']} {job['start-year']}"
-            if 'end-year' in job:
-                end = f"{job['end-month']} {job['end-year']}"
-            else:
-                end = "Present"
-            html_parts.append(f'''
-        <div class="cv-entry">
-          <div class="cv-entry-header">
-            <span class="cv-title">{job["title"]}</span>
-            <span class="cv-dates">{start} – {end}</span>
-          </div>
-          <div class="cv-org">{job["affiliation"]}, {job["location"]}</div>
-          <p class="cv-description">{job["description"]}</p>
-        </div>''')
-        html_parts.append('      </section>')
 
-    # Publications - use the same data as publications page
-    if 'bibliography' in cv_data and publications_data:
-        html_parts.append('''
-      <section class="cv-section">
-        <h2>Publications</h2>''')
-
-        bib = cv_data['bibliography']
-
-        # Create a lookup dict for publications by key
-        pubs_by_key = {pub['key']: pub for pub in publications_data}
-
-        if 'conference-papers' in bib and bib['conference-papers']:
-            html_parts.append('        <h3>Conference Papers</h3>')
-            for key in bib['conference-papers']:
-                if key in pubs_by_key:
-                    pub = pubs_by_key[key]
-                    html_parts.append(f'        <p class="pub-entry">{pub["authors"]}. <strong>{pub["title"]}</strong>. <em>{pub["venue"]}</em>, {pub["year"]}.</p>')
-
-        if 'journal-articles' in bib and bib['journal-articles']:
-            html_parts.append('        <h3>Journal Articles</h3>')
-            for key in bib['journal-articles']:
-                if key in pubs_by_key:
-                    pub = pubs_by_key[key]
-                    html_parts.append(f'        <p class="pub-entry">{pub["authors"]}. <strong>{pub["title"]}</strong>. <em>{pub["venue"]}</em>, {pub["year"]}.</p>')
-
-        if 'theses' in bib and bib['theses']:
-            html_parts.append('        <h3>Theses</h3>')
-            for key in bib['theses']:
-                if key in pubs_by_key:
-                    pub = pubs_by_key[key]
-                    html_parts.append(f'        <p class="pub-entry">{pub["authors"]}. <strong>{pub["title"]}</strong>. <em>{pub["venue"]}</em>, {pub["year"]}.</p>')
-
-        html_parts.append('      </section>')
-
-    # Awards
-    if 'awards' in cv_data:
-        html_parts.append('''
-      <section class="cv-section">
-        <h2>Awards & Recognition</h2>
-        <ul class="cv-list">''')
-        for award in cv_data['awards']:
-            if 'year' in award:
-                year_str = str(award['year'])
-            elif 'years' in award:
-                years = award['years']
-                year_str = ', '.join(str(y) for y in years)
-            else:
-                year_str = ''
-            html_parts.append(f'          <li>{award["title"]}, {year_str}</li>')
-        html_parts.append('        </ul>\n      </section>')
+def load_bib_cached(bib_path):
+    """Parse the bib file, reusing the pickled result from a previous build if unchanged."""
+    # Content hashes rather than mtimes, so the key survives a fresh CI checkout.
+    # bibliography.py's hash and the bibtexparser version stand in for a parser
+    # version: changing either invalidates entries pickled by the old code.
+    key = (_file_digest(bib_path), _file_digest(bibliography.__file__),
+           bibliography.BIBTEXPARSER_AVAILABLE, bibliography.BIBTEXPARSER_VERSION)
+    try:
+        with open(BIB_CACHE, 'rb') as f:
+            cached_key, entries = pickle.load(f)
+        if cached_key == key:
+            return entries
+    except (OSError, EOFError, ValueError, AttributeError, ImportError, pickle.UnpicklingError):
+        pass
+
+    entries = parse_bib_file(bib_path)
+    cache_dir = os.path.dirname(BIB_CACHE)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write then rename, so an interrupted build never leaves a truncated pickle
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((key, entries), f)
+        os.replace(tmp_path, BIB_CACHE)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return entries
 
-    # Skills
-    if 'skills' in cv_data:
-        html_parts.append('''
-      <section class="cv-section">
-        <h2>Skills</h2>
-        <p class="cv-skills">''' + ' · '.join(cv_data['skills']) + '</p>\n      </section>')
 
-    return '\n'.join(html_parts)
+def build_cv_pubs(cv_data, publications_data):
+    """Group formatted CV publication entries by section as (heading, [html]) pairs."""
+    # Publications - use the same data as publications page
+    bib = cv_data.get('bibliography', {})
 
+    # Create a lookup dict for publications by key
+    pubs_by_key = {pub['key']: pub for pub in publications_data}
 
-def load_cv_content():
-    """Load cv.json and bib, generate HTML for CV page."""
-    cv_json_path = os.path.join(ROOT, 'cv', 'cv.json')
-    bib_path = os.path.join(ROOT, 'roytburg.bib')
+    # Only sections with at least one matching publication are rendered
+    pubs = []
+    for category, heading in [('conference-papers', 'Conference Papers'),
+                              ('journal-articles', 'Journal Articles'),
+                              ('theses', 'Theses')]:
+        entries = [
+            f'<p class="pub-entry">{pub["authors"]}. <strong>{pub["title"]}</strong>. <em>{pub["venue"]}</em>, {pub["year"]}.</p>'
+            for pub in (pubs_by_key[key] for key in bib.get(category, []) if key in pubs_by_key)
+        ]
+        if entries:
+            pubs.append((heading, entries))
 
-    if not os.path.exists(cv_json_path) or not os.path.exists(bib_path):
-        return '<p>CV data not found.</p>'
+    return pubs
 
-    with open(cv_json_path, 'r') as f:
-        cv_data = json.load(f)
 
-    bib_entries = parse_bib_file(bib_path)
+def load_cv_context(publications_data):
+    """Load cv.json and group the already-formatted publications for cv.html."""
+    cv_json_path = os.path.join(ROOT, 'cv', 'cv.json')
 
-    # Load publications with metadata (same as publications page)
-    publications_data, _ = load_publications()
+    try:
+        with open(cv_json_path, 'r') as f:
+            cv_data = json.load(f)
+    except FileNotFoundError:
+        return {'cv': None, 'pubs': None}
 
-    return generate_cv_html(cv_data, bib_entries, publications_data)
+    return {'cv': cv_data, 'pubs': build_cv_pubs(cv_data, publications_data)}
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -331,19 +193,21 @@ def load_publications():
     bib_path = os.path.join(ROOT, 'roytburg.bib')
     meta_path = os.path.join(ROOT, 'publications_meta.json')
 
-    if not os.path.exists(bib_path):
+    try:
+        bib_entries = load_bib_cached(bib_path)
+    except FileNotFoundError:
         return [], False
 
-    bib_entries = parse_bib_file(bib_path)
-
     # Load metadata if available
-    metadata = {}
-    if os.path.exists(meta_path):
+    try:
         with open(meta_path, 'r') as f:
             metadata = json.load(f)
+    except FileNotFoundError:
+        metadata = {}
 
     publications = []
     has_equal_contrib = False
+    highlight_ctx = make_highlight_ctx('Roytburg')
 
     for key, entry in bib_entries.items():
         meta = metadata.get(key, {})
@@ -353,7 +217,7 @@ def load_publications():
             has_equal_contrib = True
 
         # Format authors with highlighting and equal contribution markers
-        authors = format_authors(entry.get('author', ''), 'Roytburg', equal_contrib)
+        authors = format_authors(entry.get('author', ''), highlight_ctx, equal_contrib)
 
         # Determine venue based on entry type
         entry_type = entry.get('_type', '')
@@ -384,8 +248,8 @@ def load_publications():
         }
         publications.append(pub)
 
-    # Sort by year descending
-    publications.sort(key=lambda x: x['year'], reverse=True)
+    # Sort by year descending; non-numeric years (e.g. "", "2023a") sort last
+    publications.sort(key=lambda x: int(x['year']) if x['year'].isdigit() else 0, reverse=True)
     return publications, has_equal_contrib
 
 
@@ -497,16 +361,24 @@ def ensure_out():
     os.makedirs(OUT, exist_ok=True)
 
 
+def _link_or_copy(src, dst):
+    """Hardlink src to dst (metadata-only), copying instead across filesystems."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def copy_static():
     dest = os.path.join(OUT, 'static')
-    shutil.copytree(STATIC, dest)
+    shutil.copytree(STATIC, dest, copy_function=_link_or_copy)
 
 
 def copy_pdfs():
     """Copy pdfs/ folder to docs/pdfs/ for downloadable files."""
     if os.path.exists(PDFS):
         dest = os.path.join(OUT, 'pdfs')
-        shutil.copytree(PDFS, dest)
+        shutil.copytree(PDFS, dest, copy_function=_link_or_copy)
         print(f'Copied pdfs/ to {dest}')
 
 
@@ -535,7 +407,12 @@ def get_last_commit_date():
 
 
 def make_env():
-    env = Environment(loader=FileSystemLoader(TEMPLATES))
+    os.makedirs(JINJA_CACHE, exist_ok=True)
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATES),
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(JINJA_CACHE),
+    )
 
     # provide a simple url_for replacement for static export
     def url_for(endpoint, filename=None):
@@ -557,18 +434,19 @@ def make_env():
     return env
 
 
+ENV = make_env()
+
+
 def render_templates():
-    env = make_env()
+    env = ENV
     # render index.html directly
     index_t = env.get_template('index.html')
     with open(os.path.join(OUT, 'index.html'), 'w', encoding='utf-8') as f:
         f.write(index_t.render())
 
-    # Generate CV content from cv.json
-    cv_content = load_cv_content()
-
-    # Load publications with metadata
+    # Load publications with metadata; the CV page reuses the same formatted entries
     publications, has_equal_contrib = load_publications()
+    cv_context = load_cv_context(publications)
 
     # Load blog posts
     blog_posts, all_tags = load_blog_posts()
@@ -580,9 +458,9 @@ def render_templates():
         template_name = f"{slug}.html"
         try:
             t = env.get_template(template_name)
-            # Pass cv_content for the CV page
+            # Pass cv.json data and grouped publications for the CV page
             if slug == 'cv':
-                html = t.render(cv_content=cv_content, title='CV')
+                html = t.render(title='CV', **cv_context)
             elif slug == 'publications':
                 html = t.render(publications=publications, has_equal_contrib=has_equal_contrib, title='Publications')
             elif slug == 'blog':
@@ -610,15 +488,19 @@ def render_templates():
 
 
 def main():
-    # First, build CV PDF from source data (cv.json + roytburg.bib)
-    build_cv_pdf()
+    # Build the CV PDF (make + LaTeX) in the background while the HTML renders;
+    # the two share no files until copy_pdfs() picks up pdfs/cv.pdf.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pdf_future = executor.submit(build_cv_pdf)
+
+        ensure_out()
+        copy_static()
+        render_templates()
+        copy_standalone()
+
+        pdf_future.result()
 
-    # Then render the static site
-    ensure_out()
-    copy_static()
     copy_pdfs()
-    render_templates()
-    copy_standalone()
     print('Static site rendered to', OUT)
 
 